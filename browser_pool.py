@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Browser pool for Playwright
+
+Starting Chromium takes hundreds of milliseconds (sometimes seconds), which is
+often longer than scraping a small page. This module launches ONE browser per
+process and keeps a few BrowserContexts ready to be borrowed and returned, so
+only the very first page pays the start-up cost.
+
+Running as root (e.g. in a Docker container)? Chromium refuses to start with
+its sandbox there, so add BROWSER_NO_SANDBOX=1 to your .env file.
+
+Usage:
+    await pool.start(size=4)
+    context = await pool.acquire_context()
+    try:
+        page = await context.new_page()
+        ...
+        await page.close()
+    finally:
+        await pool.release_context(context)
+    await pool.stop()
+"""
+
+import asyncio
+import os
+from typing import Dict, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, Route, async_playwright
+
+from http_cache import cache_enabled, cache_route
+
+
+# Chromium flags for scraping: we only need the HTML, so turn off everything
+# that draws to the screen, runs in the background, or downloads images
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Requests for these kinds of files are cancelled before they reach the network
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# ...and so are requests to these analytics/ad domains (and their subdomains)
+BLOCKED_HOSTS = (
+    "googletagmanager.com",
+    "google-analytics.com",
+    "facebook.net",
+    "hotjar.com",
+    "doubleclick.net",
+)
+
+
+class BrowserPool:
+    """
+    A fixed-size pool of BrowserContexts that share one Chromium instance.
+
+    Each context works like a separate browser profile (own cookies and storage)
+    but is much cheaper to create than a whole new browser. Contexts are handed
+    out through an asyncio.Queue, so callers wait if all of them are busy.
+    Callers open pages in the context they borrow (context.new_page() is about
+    10x cheaper than a new context) and close just the page when done.
+    """
+
+    def __init__(self, max_uses: int = 50):
+        """
+        Initialize the pool (nothing is launched until start() is called).
+
+        Args:
+            max_uses: Number of times a context can be borrowed before it is
+                      closed and replaced with a fresh one (keeps memory bounded)
+        """
+        self.max_uses = max_uses
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._queue: Optional[asyncio.Queue] = None
+
+        # How many times each context has been borrowed
+        self._uses: Dict[BrowserContext, int] = {}
+
+    async def start(self, size: int = 4, headless: bool = True):
+        """
+        Launch the browser and pre-create the contexts.
+
+        Calling start() again while the pool is running does nothing, so it is
+        safe to call from more than one place.
+
+        Args:
+            size: Number of contexts in the pool (how many pages can be open at once)
+            headless: Whether to hide the browser window (set to False to watch it work)
+        """
+        if self._browser:
+            return
+
+        # The sandbox protects the machine from the pages we visit, so it is
+        # only turned off when asked to (read here, after load_dotenv() has run)
+        args = LAUNCH_ARGS
+        if os.getenv("BROWSER_NO_SANDBOX", "").lower() in ("1", "true", "yes"):
+            args = LAUNCH_ARGS + ["--no-sandbox"]
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=headless,
+            args=args
+        )
+        self._queue = asyncio.Queue()
+
+        for _ in range(size):
+            self._queue.put_nowait(await self._new_context())
+
+        print(f"✓ Browser pool started with {size} contexts")
+
+    async def stop(self):
+        """Close every context, the browser and the Playwright driver."""
+        if not self._browser:
+            return
+
+        # Closing the browser also closes all of its contexts
+        await self._browser.close()
+        await self._playwright.stop()
+
+        self._browser = None
+        self._playwright = None
+        self._queue = None
+        self._uses.clear()
+
+        print("✓ Browser pool stopped")
+
+    async def acquire_context(self) -> BrowserContext:
+        """
+        Borrow a context from the pool, waiting until one is free.
+
+        Returns:
+            A BrowserContext - give it back with release_context() when done
+        """
+        if not self._queue:
+            raise RuntimeError("Browser pool is not running. Call start() first.")
+
+        return await self._queue.get()
+
+    async def release_context(self, context: BrowserContext):
+        """
+        Return a borrowed context to the pool.
+
+        Once a context has been used max_uses times it is closed and replaced,
+        because long-lived contexts slowly accumulate memory. Otherwise its
+        cookies are cleared, so one site's cookies (consent choices, sessions)
+        don't carry over to whatever site the context visits next.
+
+        If that fails (e.g. the context crashed), the context is replaced with
+        a fresh one. Either way a context goes back into the pool, so the pool
+        never shrinks and this method doesn't raise.
+
+        Args:
+            context: The context previously returned by acquire_context()
+        """
+        self._uses[context] += 1
+
+        try:
+            if self._uses[context] >= self.max_uses:
+                del self._uses[context]
+                await context.close()
+                context = await self._new_context()
+            else:
+                await context.clear_cookies()
+        except Exception as e:
+            print(f"✗ Browser context failed ({e}), replacing it")
+            context = await self._replace_context(context)
+
+        self._queue.put_nowait(context)
+
+    async def _replace_context(self, context: BrowserContext) -> BrowserContext:
+        """
+        Swap a broken context for a new one.
+
+        If even that fails (the browser itself is gone), the old context is
+        returned, so callers waiting in acquire_context() get an error when
+        they use it instead of waiting forever.
+        """
+        self._uses.pop(context, None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+        try:
+            return await self._new_context()
+        except Exception as e:
+            print(f"✗ Could not create a new browser context: {e}")
+            self._uses[context] = 0
+            return context
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a context and start counting its uses."""
+        context = await self._browser.new_context()
+
+        # Serve repeat requests from disk when HTTPCACHE_ENABLED is set.
+        # Playwright tries the most recently added route first, so this one
+        # is added before the blocking route below and only sees the requests
+        # that route lets through.
+        if cache_enabled():
+            await context.route("**/*", cache_route)
+
+        # Images, fonts, styles and trackers are never needed to read links
+        await context.route("**/*", _block)
+
+        self._uses[context] = 0
+        return context
+
+
+async def _block(route: Route):
+    """
+    Route handler that cancels requests the scraper doesn't need.
+
+    Everything else is passed on to the next route (the HTTP cache, if it is
+    on) or to the network.
+    """
+    request = route.request
+
+    # Host part of the URL: "https://www.example.com/path" -> "www.example.com"
+    host = request.url.partition("://")[2].partition("/")[0]
+
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(host == h or host.endswith("." + h) for h in BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+# One pool per process, shared by every caller
+pool = BrowserPool()
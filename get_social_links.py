@@ -4,26 +4,144 @@ Script to extract social media links from a website using a hybrid approach.
 
 This script demonstrates how to:
 1. Navigate to a webpage using regular Playwright
-2. Use Claude with Playwright MCP to find the CSS selector for the social links container
-3. Extract the actual links using regular Playwright (deterministic code)
-4. Process the links into a clean dictionary format with Python
+2. Find the social links container with a simple in-page rule (no AI needed)
+3. Use Claude with Playwright MCP to find the CSS selector only when the rule fails
+4. Extract the actual links using regular Playwright (deterministic code)
+5. Process the links into a clean dictionary format with Python
 
 This approach minimizes reliance on MCP and uses it only where AI-powered element
-detection is most valuable (finding the right container selector).
+detection is actually needed (pages where the simple rule can't find the container).
+
+Usage:
+    python get_social_links.py                      # scrape the default URL
+    python get_social_links.py URL [URL ...]        # scrape the given URLs
+    python get_social_links.py urls.json            # scrape a JSON list of URLs
 """
 
 import asyncio
-import json
 import os
+import sys
+from functools import lru_cache
+from typing import Optional
+import orjson
 from urllib.parse import urlparse
 from dotenv import load_dotenv
-from playwright.async_api import async_playwright
-from mcp_client import PlaywrightMCPClient
+from browser_pool import pool
+from mcp_client import PlaywrightMCPClient, close_http_client
 
 # Load environment variables from .env file
 load_dotenv()
 
+# URLs scraped when none are given on the command line
+DEFAULT_URLS = ["https://omar.house.gov/"]
+
+# How many pages can be open at the same time
+MAX_CONCURRENCY = 8
+
+# URLs per Claude conversation in the MCP step. Every page snapshot stays in
+# the conversation, so a long list would overflow Claude's context window;
+# small batches run side by side instead (each in its own MCP browser).
+MCP_BATCH_SIZE = 3
+
+# Selectors that already worked, by site (e.g. {"omar.house.gov": ".evo-social-icons-here"}).
+# Sites listed here skip the container search entirely.
+KNOWN_SELECTORS_FILE = "known_selectors.json"
+
+# Domains that count as social media links when looking for the container
+SOCIAL_HOSTS = [
+    "facebook.com",
+    "twitter.com",
+    "x.com",
+    "instagram.com",
+    "youtube.com",
+    "linkedin.com",
+    "tiktok.com",
+]
+
+# JavaScript function shared by the two snippets below: which of the SOCIAL_HOSTS
+# (passed in as `hosts`) a link points to, or undefined. The host is compared
+# exactly (or as a subdomain), so "dropbox.com" doesn't count as "x.com".
+# The href is parsed with URL() because SVG <a> elements have no .hostname.
+PLATFORM_OF_JS = """
+    const platformOf = a => {
+        let host;
+        try {
+            host = new URL(a.getAttribute('href'), location.href).hostname;
+        } catch (e) {
+            return undefined;
+        }
+        host = host.toLowerCase().replace(/^www\\./, '');
+        return hosts.find(h => host === h || host.endsWith('.' + h));
+    };
+"""
+
+# JavaScript that is true once the page has at least one social link
+HAS_SOCIAL_LINK_JS = "hosts => {" + PLATFORM_OF_JS + """
+    return [...document.querySelectorAll('a[href]')].some(platformOf);
+}
+"""
+
+# JavaScript run inside the page by find_container_heuristic().
+# For every social link it walks up the DOM tree, recording which platforms
+# each ancestor element contains. The container is the ancestor that holds the
+# most different platforms; if several tie, the deepest (smallest) one wins.
+# It then builds a CSS selector for it: "#id" if it has one, otherwise a
+# "parent > child:nth-child(n)" path up to the nearest element with an id,
+# and reads the hrefs of the links inside it.
+FIND_CONTAINER_JS = "hosts => {" + PLATFORM_OF_JS + """
+    const depthOf = el => {
+        let d = 0;
+        for (; el; el = el.parentElement) d++;
+        return d;
+    };
+
+    const platforms = new Map();
+    for (const a of document.querySelectorAll('a[href]')) {
+        const platform = platformOf(a);
+        if (!platform) continue;
+        for (let el = a.parentElement; el; el = el.parentElement) {
+            if (!platforms.has(el)) platforms.set(el, new Set());
+            platforms.get(el).add(platform);
+        }
+    }
+
+    let best = null, bestHits = 0, bestDepth = 0;
+    for (const [el, found] of platforms) {
+        const d = depthOf(el);
+        if (found.size > bestHits || (found.size === bestHits && d > bestDepth)) {
+            best = el;
+            bestHits = found.size;
+            bestDepth = d;
+        }
+    }
+    if (!best) return null;
+
+    const parts = [];
+    for (let el = best; el && el !== document.documentElement; el = el.parentElement) {
+        if (el.id) {
+            parts.unshift('#' + CSS.escape(el.id));
+            break;
+        }
+        let part = el.tagName.toLowerCase();
+        const siblings = el.parentElement ? [...el.parentElement.children] : [];
+        if (siblings.length > 1) part += `:nth-child(${siblings.indexOf(el) + 1})`;
+        parts.unshift(part);
+    }
+
+    const links = [...best.querySelectorAll('a')]
+        .map(a => a.getAttribute('href'))
+        .filter(Boolean);
+
+    return {selector: parts.join(' > '), hits: bestHits, links};
+}
+"""
+
+
+# Characters urlparse ignores at the start of a URL (ASCII control characters and space)
+_C0_CONTROL_OR_SPACE = "".join(chr(i) for i in range(33))
 
+
+@lru_cache(maxsize=4096)
 def extract_domain_name(url):
     """
     Extract the social media platform name from a URL.
@@ -32,58 +150,194 @@ def extract_domain_name(url):
         https://instagram.com/repilhan -> instagram
         https://www.facebook.com/RepIlhan/ -> facebook
         https://x.com/Ilhan -> x
+        " https://face\tbook.com" -> facebook (cleaned up like urlparse does)
+        /share?u=https://facebook.com/x -> "" (relative link)
+
+    This uses plain string methods instead of urllib's urlparse (which is much
+    slower), and results are cached because batches of pages link to the same
+    profiles over and over.
 
     Args:
         url: The social media URL
 
     Returns:
-        The platform name (domain without www or TLD variations)
+        The platform name (domain without www or TLD variations),
+        or an empty string for links without a domain (e.g. "/contact")
     """
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
+    # href attributes are read as written, so clean them up the way urlparse
+    # (and the browser) does: skip leading spaces and control characters, and
+    # drop tabs and newlines anywhere in the URL
+    url = url.lstrip(_C0_CONTROL_OR_SPACE)
+    if '\t' in url or '\r' in url or '\n' in url:
+        url = url.replace('\t', '').replace('\r', '').replace('\n', '')
+
+    # Skip past the scheme ("https://"); "//host/path" links have no scheme
+    if url.startswith('//'):
+        rest = url[2:]
+    else:
+        scheme, sep, rest = url.partition('://')
+        # Only a real scheme counts (letters, digits, "+", "-", "."), so a "://"
+        # later in a relative link like "/share?u=https://facebook.com/x" is
+        # ignored, just as urlparse does
+        if not sep or not _is_scheme(scheme):
+            return ''
+
+    # The domain ends at the first "/", "?" or "#"
+    end = len(rest)
+    for char in '/?#':
+        i = rest.find(char, 0, end)
+        if i != -1:
+            end = i
+    domain = rest[:end].lower()
 
     # Remove 'www.' prefix if present
     if domain.startswith('www.'):
         domain = domain[4:]
 
     # Extract the main platform name (before the first dot)
-    platform = domain.split('.')[0]
+    return domain.partition('.')[0]
 
-    return platform
 
+def _is_scheme(text):
+    """Check whether text is a valid URL scheme like "https" (same rule as urlparse)."""
+    return (text[:1].isascii() and text[:1].isalpha()
+            and all(c.isascii() and (c.isalnum() or c in '+-.') for c in text))
 
-def process_social_links(links):
+
+def process_social_links(links, first_wins=False):
     """
     Convert a list of social media URLs into a dictionary.
 
+    If several links point to the same platform, only one is kept: the last
+    one by default, or the first one with first_wins=True.
+
     Args:
         links: List of social media URLs
+        first_wins: Keep the first link for each platform instead of the last
 
     Returns:
         Dictionary with platform names as keys and URLs as values
         Example: {"instagram": "https://instagram.com/repilhan", ...}
     """
-    social_dict = {}
+    if first_wins:
+        social_dict = {}
+        for url in links:
+            social_dict.setdefault(extract_domain_name(url), url)
+        return social_dict
+
+    # Later links overwrite earlier ones for the same platform
+    return {extract_domain_name(url): url for url in links}
+
+
+# The MCP client is created once and shared by every lookup in this process.
+# Starting the MCP server (npx + browser) takes several seconds, so we only
+# want to pay that cost once.
+_CLIENT: Optional[PlaywrightMCPClient] = None
+
+
+async def get_client(api_key):
+    """
+    Return the shared MCP client, connecting to the server on first use.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        A connected PlaywrightMCPClient
+    """
+    global _CLIENT
+
+    if _CLIENT is None:
+        client = PlaywrightMCPClient(api_key)
+        await client.connect()
+        _CLIENT = client
+
+    return _CLIENT
+
+
+async def close_client():
+    """
+    Disconnect the shared MCP client if it was ever connected, and close the
+    HTTP connections it used to talk to Claude.
+
+    This has to run inside the event loop that connected the client (the MCP
+    connection cannot be closed from an atexit hook after the loop is gone),
+    so main() calls it in its finally block.
+    """
+    global _CLIENT
 
-    for url in links:
-        platform = extract_domain_name(url)
-        social_dict[platform] = url
+    if _CLIENT is not None:
+        await _CLIENT.disconnect()
+        await close_http_client()
+        _CLIENT = None
 
-    return social_dict
 
+# Prompt sent to Claude by get_container_selector_with_mcp().
+# {url_list} is replaced with the URLs to analyze, one per line.
+SELECTOR_PROMPT = """
+Please use the Playwright MCP tools to complete the following task for EACH of these URLs:
 
-async def get_container_selector_with_mcp(url):
+{url_list}
+
+1. Navigate to the URL
+2. Close any popups if they appear
+3. Find the container element that holds the social media links (Facebook, Twitter/X, Instagram, YouTube, etc.)
+
+When you have done this for every URL, return all the CSS selectors at once using the "report_selectors" tool.
+Copy each URL into the report exactly as it is written above.
+
+IMPORTANT: Return the CSS selector for the CONTAINER element, not the individual links.
+The selector should be something that can be passed to page.locator() in Playwright.
+For example: "nav.social-links", ".footer-social", "[aria-label='Social Media']", etc.
+
+Do not wait for a fixed amount of time - navigation already waits for the page.
+If the links are not there yet, wait for their text to appear instead.
+"""
+
+# Structured output tool Claude uses to report one selector per URL
+REPORT_SELECTORS_TOOL = {
+    "name": "report_selectors",
+    "description": "Report the CSS selector for the social links container of each URL",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "url": {
+                            "type": "string",
+                            "description": "The URL that was analyzed"
+                        },
+                        "selector": {
+                            "type": "string",
+                            "description": "The CSS selector for the container element holding the social media links"
+                        }
+                    },
+                    "required": ["url", "selector"]
+                }
+            }
+        },
+        "required": ["items"]
+    }
+}
+
+
+async def get_container_selector_with_mcp(urls):
     """
     Use Claude with Playwright MCP to find the CSS selector for the social links container.
 
-    This function uses MCP ONLY to identify the container selector, not to extract the links.
-    It will navigate to the page via MCP and ask Claude to find the appropriate selector.
+    This function uses MCP ONLY to identify the container selectors, not to extract the links.
+    The URLs are split into batches of MCP_BATCH_SIZE; each batch is one agentic
+    loop, and the loops run at the same time on the client's pool of MCP sessions.
 
     Args:
-        url: The website URL to analyze
+        urls: List of website URLs to analyze
 
     Returns:
-        CSS selector string for the container with social media links
+        Dictionary mapping each URL to the CSS selector of its social links container.
+        URLs Claude could not find a selector for are left out.
     """
     # Check if API key is set
     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -91,123 +345,283 @@ async def get_container_selector_with_mcp(url):
         print("\nError: Please set your ANTHROPIC_API_KEY in the .env file")
         print("Get your API key from: https://console.anthropic.com/settings/keys")
         print("Then add it to the .env file in this directory\n")
-        return None
+        return {}
+
+    # Get the shared MCP client (connects on the first call only)
+    client = await get_client(api_key)
+
+    # Fill in the prompt for Claude - asking ONLY for the container selectors
+    batches = [urls[i:i + MCP_BATCH_SIZE] for i in range(0, len(urls), MCP_BATCH_SIZE)]
+    prompts = [
+        SELECTOR_PROMPT.format(url_list="\n".join(f"- {url}" for url in batch))
+        for batch in batches
+    ]
+
+    # Run the agentic loops with structured output
+    # (each URL needs several tool calls, so the iteration budget grows with the batch)
+    responses = await client.run_many(
+        prompts,
+        max_iterations=15 * MCP_BATCH_SIZE,
+        final_answer_tool=REPORT_SELECTORS_TOOL
+    )
+
+    selectors = {}
+    for batch, response in zip(batches, responses):
+        if isinstance(response, Exception):
+            print(f"✗ MCP lookup failed for {', '.join(batch)}: {response}")
+            continue
+
+        # Extract the selectors from the structured response
+        if not (isinstance(response, dict) and "items" in response):
+            print(f"Unexpected response format: {response}")
+            continue
 
-    # Create the MCP client
-    client = PlaywrightMCPClient(api_key)
+        # Claude sometimes changes a URL slightly when copying it (e.g. adds a
+        # trailing slash), so match the reported URLs back to the ones we sent
+        # and ignore any URL we didn't ask about
+        sent = {url_match_key(url): url for url in batch}
+        for item in response["items"]:
+            url = sent.get(url_match_key(item["url"]))
+            if url:
+                selectors[url] = item["selector"]
 
-    try:
-        # Connect to the Playwright MCP server
-        await client.connect()
+    return selectors
 
-        # Create the prompt for Claude - asking ONLY for the container selector
-        user_message = f"""
-Please use the Playwright MCP tools to complete the following task:
 
-1. Navigate to {url}
-2. Wait for the page to load
-3. Close any popups if they appear
-4. Find the container element that holds the social media links (Facebook, Twitter/X, Instagram, YouTube, etc.)
-5. Return the CSS selector for that container using the "report_selector" tool
+def url_match_key(url):
+    """
+    Reduce a URL to the parts that matter when comparing two copies of it.
 
-IMPORTANT: Return the CSS selector for the CONTAINER element, not the individual links.
-The selector should be something that can be passed to page.locator() in Playwright.
-For example: "nav.social-links", ".footer-social", "[aria-label='Social Media']", etc.
-"""
+    Example:
+        https://www.Example.com/about/ -> example.com/about
 
-        # Define a structured output tool for Claude to report the selector
-        final_answer_tool = {
-            "name": "report_selector",
-            "description": "Report the CSS selector for the social links container",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "selector": {
-                        "type": "string",
-                        "description": "The CSS selector for the container element holding the social media links"
-                    }
-                },
-                "required": ["selector"]
-            }
-        }
+    Args:
+        url: The website URL
 
-        # Run the agentic loop with structured output
-        response = await client.run_agent_loop(
-            user_message,
-            max_iterations=15,
-            final_answer_tool=final_answer_tool
-        )
+    Returns:
+        The URL without scheme, leading "www." or trailing "/", in lower case
+    """
+    url = url.strip().lower()
+    url = url.partition('://')[2] or url
+    return url.removeprefix('www.').rstrip('/')
 
-        # Extract the selector from the structured response
-        if isinstance(response, dict) and "selector" in response:
-            selector = response["selector"]
-            return selector
-        else:
-            print(f"Unexpected response format: {response}")
-            return None
 
-    finally:
-        # Always disconnect from the MCP server
-        await client.disconnect()
+async def find_container_heuristic(page):
+    """
+    Find the social links container with a simple rule instead of AI.
 
+    Runs FIND_CONTAINER_JS inside the page (one call): the container is the
+    smallest element holding links to the most different social platforms.
+    The same call also reads the links in it, so no second lookup is needed.
 
-async def extract_social_links_with_playwright(url, container_selector):
+    Args:
+        page: A Playwright page that has already navigated to the website
+
+    Returns:
+        Tuple of (CSS selector for the container, list of link URLs in it),
+        or None if fewer than 2 platforms were found
+    """
+    # Wait until at least one social link exists (returns as soon as it does),
+    # then find the container. Either step can fail on unusual pages; then
+    # there is simply no heuristic answer for this page.
+    try:
+        await page.wait_for_function(HAS_SOCIAL_LINK_JS, arg=SOCIAL_HOSTS, timeout=5000)
+        result = await page.evaluate(FIND_CONTAINER_JS, SOCIAL_HOSTS)
+    except Exception:
+        return None
+
+    # A single social link is not enough to be confident it's the right container
+    if not result or result["hits"] < 2:
+        return None
+
+    return result["selector"], result["links"]
+
+
+async def extract_social_links_with_playwright(context, url, container_selector=None):
     """
     Use regular Playwright to navigate to a page and extract all links from a container.
 
     This is deterministic code that doesn't require AI - it simply:
-    1. Navigates to the URL
-    2. Finds the container using the provided selector
+    1. Opens a new page in a pooled browser context
+    2. Navigates to the URL and finds the container, either using the provided
+       selector or, if none is given, using find_container_heuristic()
     3. Extracts all links from within that container
 
     Args:
+        context: A BrowserContext borrowed from the browser pool
         url: The website URL to scrape
-        container_selector: CSS selector for the container element
+        container_selector: CSS selector for the container element (optional)
 
     Returns:
-        List of all link URLs found in the container
+        Tuple of (container selector, list of all link URLs found in the container).
+        The selector is None if none was given and the heuristic found nothing.
     """
-    async with async_playwright() as p:
-        # Launch browser (headless mode)
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
+    # Open a new tab in the already-running browser (much faster than launching one)
+    page = await context.new_page()
 
+    try:
+        # Navigate to the URL (wait for DOM to load, not network idle)
+        print(f"Navigating to {url}...")
+        await page.goto(url, wait_until='domcontentloaded')
+
+        # No selector given: try to find the container without AI.
+        # The heuristic reads the links too, so we can return straight away.
+        if container_selector is None:
+            found = await find_container_heuristic(page)
+            if found is None:
+                print(f"Heuristic could not find a social links container on {url}")
+                return None, []
+
+            container_selector, all_links = found
+            print(f"Found container with selector: {container_selector}")
+            print(f"Found {len(all_links)} links in the container")
+            return container_selector, all_links
+
+        # Find the container element
+        container = page.locator(container_selector)
+
+        # Wait for the container to be visible on the page
         try:
-            # Navigate to the URL (wait for DOM to load, not network idle)
-            print(f"Navigating to {url}...")
-            await page.goto(url, wait_until='domcontentloaded')
+            await container.first.wait_for(state='attached', timeout=10000)
+            print(f"Found container with selector: {container_selector}")
+        except Exception as e:
+            print(f"Warning: Container '{container_selector}' not found or not visible: {e}")
+            return container_selector, []
+
+        # Extract the href of every link in the container with ONE call into the page.
+        # (Asking for each link separately would be one browser round trip per link.)
+        # filter(Boolean) drops links without an href.
+        all_links = await container.locator('a').evaluate_all(
+            "els => els.map(e => e.getAttribute('href')).filter(Boolean)"
+        )
+        print(f"Found {len(all_links)} links in the container")
 
-            # Find the container element
-            container = page.locator(container_selector)
+        return container_selector, all_links
 
-            # Wait for the container to be visible on the page
-            try:
-                await container.first.wait_for(state='attached', timeout=10000)
-                print(f"Found container with selector: {container_selector}")
-            except Exception as e:
-                print(f"Warning: Container '{container_selector}' not found or not visible: {e}")
-                return []
+    finally:
+        # Close only the tab - the browser stays open for the next URL
+        await page.close()
 
-            # Get all links within the container
-            links = container.locator('a')
-            link_count = await links.count()
-            print(f"Found {link_count} links in the container")
 
-            # Extract href attributes from all links
-            all_links = []
-            for i in range(link_count):
-                link = links.nth(i)
-                href = await link.get_attribute('href')
+async def process_url(url, container_selector, sem, pool):
+    """
+    Extract and process the social links for one URL.
 
-                # Add any valid href to the list
-                if href:
-                    all_links.append(href)
+    Several of these run at the same time (see main); the semaphore caps how
+    many pages are open at once.
 
-            return all_links
+    Args:
+        url: The website URL to scrape
+        container_selector: CSS selector for the social links container,
+                            or None to find it with find_container_heuristic()
+        sem: asyncio.Semaphore limiting how many URLs are processed concurrently
+        pool: The BrowserPool to borrow a browser context from
 
+    Returns:
+        Tuple of (container selector or None, dictionary with platform names as
+        keys and URLs as values). If the page can't be scraped (e.g. it doesn't
+        load), the dictionary is empty, so the other URLs still get their results.
+    """
+    async with sem:
+        context = await pool.acquire_context()
+        try:
+            container_selector, social_links_list = await extract_social_links_with_playwright(
+                context, url, container_selector
+            )
+        except Exception as e:
+            print(f"✗ Error scraping {url}: {e}")
+            return container_selector, {}
         finally:
-            # Close the browser
-            await browser.close()
+            await pool.release_context(context)
+
+    if social_links_list:
+        print(f"✓ Extracted {len(social_links_list)} social media links from {url}")
+    return container_selector, process_social_links(social_links_list)
+
+
+async def process_all(url_selectors, sem, pool):
+    """
+    Run process_url() for several URLs at the same time.
+
+    Args:
+        url_selectors: Dictionary mapping each URL to its container selector
+                       (or None to find it with find_container_heuristic())
+        sem: asyncio.Semaphore limiting how many URLs are processed concurrently
+        pool: The BrowserPool to borrow browser contexts from
+
+    Returns:
+        Dictionary mapping each URL to a (selector, social links dict) tuple
+    """
+    urls = list(url_selectors)
+    processed = await asyncio.gather(
+        *[process_url(url, url_selectors[url], sem, pool) for url in urls]
+    )
+    return dict(zip(urls, processed))
+
+
+def site_key(url):
+    """
+    Get the key a site is stored under in KNOWN_SELECTORS_FILE.
+
+    Example:
+        https://www.example.com/about -> example.com
+
+    Args:
+        url: The website URL
+
+    Returns:
+        The URL's host name without a leading "www."
+    """
+    return urlparse(url).netloc.lower().removeprefix('www.')
+
+
+def load_known_selectors():
+    """
+    Read the saved site -> selector mapping.
+
+    Returns:
+        Dictionary of known selectors (empty if the file doesn't exist yet)
+    """
+    try:
+        with open(KNOWN_SELECTORS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+
+def save_known_selectors(known):
+    """
+    Write the site -> selector mapping back to KNOWN_SELECTORS_FILE.
+
+    Args:
+        known: Dictionary of known selectors
+    """
+    with open(KNOWN_SELECTORS_FILE, 'wb') as f:
+        f.write(orjson.dumps(known, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+
+def load_target_urls(args):
+    """
+    Build the list of URLs to scrape from the command line arguments.
+
+    Each argument is either a URL or the path to a .json file containing a
+    list of URLs. With no arguments, DEFAULT_URLS is used.
+
+    Args:
+        args: Command line arguments (usually sys.argv[1:])
+
+    Returns:
+        List of URLs
+    """
+    urls = []
+    for arg in args:
+        if arg.endswith('.json'):
+            with open(arg, 'rb') as f:
+                urls.extend(orjson.loads(f.read()))
+        else:
+            urls.append(arg)
+
+    return urls or DEFAULT_URLS
 
 
 async def main():
@@ -215,58 +629,118 @@ async def main():
     Main function to run the social links extraction using a hybrid approach.
 
     Workflow:
-    1. Use MCP to get the CSS selector for the social links container
-    2. Use regular Playwright to navigate and extract the actual links
-    3. Process the results into a clean dictionary format
+    1. Use regular Playwright to extract the links (all URLs in parallel), using
+       the saved selector for known sites and a simple rule for the others
+    2. Use MCP to get the CSS selector for the URLs where that didn't work
+    3. Use regular Playwright to extract the links from those URLs
+    4. Process the results into a clean dictionary format and remember the
+       selectors that worked for next time
     """
-    # The URL to scrape for social media links
-    target_url = "https://omar.house.gov/"
+    # The URLs to scrape for social media links
+    target_urls = load_target_urls(sys.argv[1:])
+    known = load_known_selectors()
 
     print("=" * 70)
     print("  Social Media Links Extractor")
-    print("  (Hybrid: MCP for selector + Playwright for extraction)")
+    print("  (Hybrid: saved/rule/MCP selector + Playwright for extraction)")
     print("=" * 70)
-    print(f"Target URL: {target_url}\n")
+    print("Target URLs:")
+    for url in target_urls:
+        print(f"  - {url}")
+    print()
 
-    # Step 1: Use MCP to get the container selector
-    print("Step 1: Using Playwright MCP to find container selector...")
-    container_selector = await get_container_selector_with_mcp(target_url)
+    # The tasks below mostly wait on the network, so running them together means
+    # the total time is close to the slowest page instead of the sum of all pages.
+    # The browser is launched once here and reused for every page we open.
+    await pool.start(size=MAX_CONCURRENCY)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
 
-    if not container_selector:
-        print("\n✗ Failed to get container selector from MCP")
-        return
+    try:
+        # Step 1: Use the saved selector if we have one, otherwise find the
+        # container without AI, and extract the links
+        print("Step 1: Using regular Playwright to find containers and extract links...")
+        saved = {url: known.get(site_key(url)) for url in target_urls}
+        found = await process_all(saved, sem, pool)
+
+        # A saved selector that finds no links may mean the site has changed:
+        # look for the container again. The saved selector is only replaced
+        # once a new one finds links (below), so a page that just failed to
+        # load this time doesn't lose its selector.
+        stale = [url for url, (_, links) in found.items() if not links and saved[url]]
+        if stale:
+            for url in stale:
+                print(f"Saved selector for {url} found no links, searching again...")
+            found.update(await process_all(dict.fromkeys(stale), sem, pool))
+
+        # Step 2: Ask Claude (via MCP) only about the pages that are still missing
+        missing = [url for url, (_, links) in found.items() if not links]
+        if missing:
+            print("\nStep 2: Using Playwright MCP to find the remaining container selectors...")
+            try:
+                mcp_selectors = await get_container_selector_with_mcp(missing)
+            except Exception as e:
+                # Keep the results from Step 1 even if the MCP lookup fails
+                print(f"✗ MCP lookup failed: {e}")
+                mcp_selectors = {}
+            finally:
+                # Always disconnect from the MCP server
+                await close_client()
+
+            for url in missing:
+                if url not in mcp_selectors:
+                    print(f"✗ Failed to get container selector for {url}")
+
+            # Step 3: Extract the links using the selectors Claude found
+            if mcp_selectors:
+                print("\nStep 3: Using regular Playwright to extract the remaining links...")
+                found.update(await process_all(mcp_selectors, sem, pool))
+    finally:
+        await pool.stop()
 
-    print(f"✓ Got container selector: {container_selector}\n")
+    # Keep only the URLs where links were found
+    selectors = {url: selector for url, (selector, links) in found.items() if links}
+    results = {url: links for url, (_, links) in found.items() if links}
 
-    # Step 2: Use regular Playwright to extract the links
-    print("Step 2: Using regular Playwright to extract links...")
-    social_links_list = await extract_social_links_with_playwright(target_url, container_selector)
+    # Remember the selectors that worked so the next run can skip the search
+    # (sites where nothing worked this time keep the selector they had)
+    for url, selector in selectors.items():
+        known[site_key(url)] = selector
+    save_known_selectors(known)
 
-    if not social_links_list:
+    print()
+    for url, selector in selectors.items():
+        print(f"✓ Container selector for {url}: {selector}")
+
+    if not results:
         print("\n✗ No social links found")
         return
 
-    print(f"\n✓ Extracted {len(social_links_list)} social media links")
-
-    # Step 3: Process the links into dictionary format using Python
-    print("\nStep 3: Processing links into dictionary format...")
-    social_links_dict = process_social_links(social_links_list)
+    # Encode the results once as formatted JSON (orjson produces bytes directly,
+    # so the same data can be written to the file without encoding it again)
+    data = orjson.dumps(results, option=orjson.OPT_INDENT_2)
 
-    # Print the result as formatted JSON
+    # Print the result
     print("\n" + "=" * 70)
     print("Social Media Links:")
     print("=" * 70)
-    print(json.dumps(social_links_dict, indent=2))
+    print(data.decode())
 
     # Also save to a file
     output_file = "social_links.json"
-    with open(output_file, 'w') as f:
-        json.dump(social_links_dict, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(data)
 
     print(f"\n✓ Results saved to {output_file}")
     print("=" * 70)
 
 
 if __name__ == "__main__":
+    # Use uvloop (a faster drop-in event loop) if it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run the async main function
     asyncio.run(main())
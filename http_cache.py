@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP cache for Playwright
+
+While working on selectors you run the scraper against the same pages again
+and again. With the cache turned on, every GET response the browser receives
+is saved to disk, and later runs answer those requests from disk instead of
+the network.
+
+Turn it on by adding these to your .env file:
+    HTTPCACHE_ENABLED=1
+    HTTPCACHE_DIR=.http_cache     (optional, this is the default)
+    HTTPCACHE_TTL=3600            (optional, seconds before an entry expires; 0 = never)
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from playwright.async_api import Route
+
+# These headers describe how the ORIGINAL response was sent over the wire.
+# The saved body is already decoded, so replaying them would confuse the browser.
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def cache_enabled() -> bool:
+    """
+    Check whether the HTTP cache is switched on.
+
+    This reads the environment every time (instead of once at import) so that
+    values loaded from .env by load_dotenv() are picked up.
+
+    Returns:
+        True if HTTPCACHE_ENABLED is set to 1/true/yes
+    """
+    return os.getenv("HTTPCACHE_ENABLED", "").lower() in ("1", "true", "yes")
+
+
+async def cache_route(route: Route):
+    """
+    Route handler that serves GET requests from the disk cache.
+
+    On a hit, the saved response is returned without touching the network.
+    On a miss, the request is sent, the response is saved, and then returned.
+
+    Register it with: await context.route("**/*", cache_route)
+
+    Args:
+        route: The intercepted request (given to us by Playwright)
+    """
+    request = route.request
+
+    # Only GET requests are safe to replay
+    if request.method != "GET":
+        await route.fallback()
+        return
+
+    # Each URL gets its own pair of files, named after a hash of the URL
+    cache_dir = Path(os.getenv("HTTPCACHE_DIR", ".http_cache"))
+    key = hashlib.sha1(request.url.encode()).hexdigest()
+    body_path = cache_dir / f"{key}.bin"
+    meta_path = cache_dir / f"{key}.json"
+
+    # Cache hit: answer from disk. The two files are written separately, so if
+    # one is missing or unreadable (e.g. an interrupted write) it counts as a miss.
+    if meta_path.exists() and not _is_expired(meta_path):
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            pass
+        else:
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+    # Cache miss: fetch from the network. If that fails (DNS, connection, TLS),
+    # fail the request right away - an error raised here would only be logged
+    # and leave the page waiting until it times out.
+    try:
+        response = await route.fetch()
+        body = await response.body()
+    except Exception:
+        await route.abort()
+        return
+    headers = {
+        name: value for name, value in response.headers.items()
+        if name.lower() not in _SKIP_HEADERS
+    }
+
+    # Only keep successful responses - errors should be retried next time
+    if response.ok:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps({
+            "url": request.url,
+            "status": response.status,
+            "headers": headers
+        }))
+
+    await route.fulfill(status=response.status, headers=headers, body=body)
+
+
+def _is_expired(meta_path: Path) -> bool:
+    """Check whether a cache entry is older than HTTPCACHE_TTL seconds."""
+    ttl = float(os.getenv("HTTPCACHE_TTL", "0"))
+    if ttl <= 0:
+        return False
+
+    return time.time() - meta_path.stat().st_mtime > ttl
@@ -4,16 +4,185 @@ MCP Client for Playwright Integration
 
 This module provides a client for connecting to the Playwright MCP server
 and using it with Claude via the Anthropic API.
+
+Set VERBOSE_MCP=1 (e.g. in your .env file) to see each step of the agent loop.
+Set PLAYWRIGHT_MCP_VERSION (e.g. 0.0.41) to pin the @playwright/mcp version
+that npx starts instead of checking npm for "latest" on every connect.
 """
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
-from contextlib import AsyncExitStack
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import orjson
+
+# anthropic, httpx and mcp are big packages that take a while to import, so
+# they are imported inside the functions that use them. Importing this module
+# (e.g. just to check types) stays fast. The imports below only run for type
+# checkers, which is why those type hints are written in quotes.
+if TYPE_CHECKING:
+    import httpx
+    from mcp import ClientSession
+
+
+# One HTTP connection pool for talking to the Anthropic API, shared by every
+# PlaywrightMCPClient in this process. Keeping connections open between calls
+# means we don't redo the DNS lookup and TLS handshake for each message.
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+
+def get_http_client() -> "httpx.AsyncClient":
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Returns:
+        An httpx.AsyncClient with keep-alive connection pooling
+    """
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        import httpx
+        from anthropic import DefaultAsyncHttpxClient
+
+        _HTTP_CLIENT = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300
+            ),
+            timeout=httpx.Timeout(60.0)
+        )
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from anthropic import Anthropic
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    """
+    Close the shared HTTP client.
+
+    Call this once when the program is done with every PlaywrightMCPClient
+    (they all share the same HTTP client).
+    """
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+# Playwright MCP tools that only look at the page without changing it.
+# These can run at the same time as each other.
+READONLY_TOOLS = frozenset({
+    "browser_snapshot",
+    "browser_take_screenshot",
+    "browser_console_messages",
+    "browser_network_requests",
+})
+
+# The read-only tools that give the same answer when called twice in a row
+# (as long as no other tool changed the page), so their results are cached.
+# Console messages and network requests are not: they keep growing while the
+# page's scripts run.
+CACHEABLE_TOOLS = frozenset({
+    "browser_snapshot",
+    "browser_take_screenshot",
+})
+
+# After these tools, Claude almost always asks for this read-only tool next
+# (e.g. after navigating it wants to see the page), so it is started right
+# away and its result is waiting in the cache when Claude asks for it
+SPECULATION_MAP = {
+    "browser_navigate": "browser_snapshot",
+    "browser_click": "browser_snapshot",
+}
+
+
+def _concat_texts(content: List[Any]) -> str:
+    """
+    Join the text items of an MCP tool result into one string.
+
+    Non-text items (e.g. images from a screenshot) are skipped. str.join runs
+    in C and sizes the result once, so this is a single pass even for results
+    with thousands of items.
+
+    Args:
+        content: The content list of an MCP tool result
+
+    Returns:
+        The text items separated by newlines
+    """
+    return "\n".join(item.text for item in content if item.type == "text")
+
+
+async def _cancel_and_wait(tasks: List[asyncio.Task]):
+    """
+    Cancel tool calls and wait until they have actually stopped.
+
+    cancel() only asks a task to stop. Waiting for it makes sure no tool call
+    is still using the browser when the session goes back to the pool.
+
+    Args:
+        tasks: The tasks to stop
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class ToolResultCache:
+    """
+    Remembers the results of cacheable tool calls (CACHEABLE_TOOLS) within one agent loop.
+
+    Claude often asks for the same snapshot twice. As long as nothing has
+    changed the page since, the saved result is returned instead of asking the
+    browser again. Any other tool (navigate, click, type, ...) may change the
+    page, so calling one empties the cache.
+
+    Old entries are dropped once max_size is reached (least recently used first).
+
+    An entry can also be an asyncio.Task for a speculative call that is still
+    running (see SPECULATION_MAP); clearing the cache cancels those.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    @staticmethod
+    def key(tool_name: str, tool_input: Dict[str, Any]) -> str:
+        """Build the cache key for a tool call (same name + same input = same key)."""
+        return tool_name + "|" + orjson.dumps(tool_input, option=orjson.OPT_SORT_KEYS).decode()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the saved result for a key, or None."""
+        if key not in self._entries:
+            return None
+
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: str, result: Any):
+        """Save a result, dropping the least recently used one if full."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> List[asyncio.Task]:
+        """
+        Forget everything (the page may have changed) and stop speculative calls.
+
+        Returns:
+            The speculative tasks that were cancelled (await them to be sure
+            they have stopped)
+        """
+        tasks = [entry for entry in self._entries.values() if isinstance(entry, asyncio.Task)]
+        for task in tasks:
+            task.cancel()
+        self._entries.clear()
+        return tasks
 
 
 class PlaywrightMCPClient:
@@ -21,65 +190,132 @@ class PlaywrightMCPClient:
     Client for interacting with Playwright MCP server and Claude.
 
     This class:
-    1. Connects to the Playwright MCP server via stdio
+    1. Connects to the Playwright MCP server via stdio (through a pool of
+       warm sessions, see mcp_pool.py)
     2. Retrieves available tools from the server
     3. Converts MCP tools to Anthropic tool format
     4. Handles the agentic loop for tool calling with Claude
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        tool_cache_ttl_s: float = 300.0,
+        max_parallel_tools: int = 4,
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        tool_result_cache_size: int = 64,
+        max_tool_result_chars: int = 50_000
+    ):
         """
         Initialize the MCP client.
 
         Args:
             api_key: Anthropic API key
+            tool_cache_ttl_s: How long (in seconds) the tool list fetched from the
+                              MCP server is reused before it is fetched again
+            max_parallel_tools: How many read-only tool calls from one Claude
+                                response may run at the same time (tools that
+                                change the page always run one at a time)
+            min_sessions: MCP sessions connected by connect()
+            max_sessions: Maximum number of MCP sessions (agent loops that can
+                          run at the same time, each with its own browser)
+            tool_result_cache_size: How many read-only tool results one agent
+                                    loop remembers (see ToolResultCache)
+            max_tool_result_chars: Tool results longer than this lose their middle
+                                   before being sent to Claude
         """
+        from anthropic import AsyncAnthropic
+        from mcp import StdioServerParameters
+        from mcp_pool import MCPSessionPool
+
         self.api_key = api_key
-        self.anthropic = Anthropic(api_key=api_key)
-        self.session: Optional[ClientSession] = None
-        self.exit_stack = AsyncExitStack()
+        # The async client lets the event loop keep running MCP tool calls
+        # while we wait for Claude's response
+        self.anthropic = AsyncAnthropic(api_key=api_key, http_client=get_http_client())
+        self.max_parallel_tools = max_parallel_tools
+        self.tool_result_cache_size = tool_result_cache_size
+        self.max_tool_result_chars = max_tool_result_chars
+
+        # Progress messages are only printed when VERBOSE_MCP is set (e.g. in .env),
+        # so a busy agent loop doesn't spend time building text nobody reads
+        self.verbose = os.getenv("VERBOSE_MCP", "").lower() in ("1", "true", "yes")
 
-    async def connect(self):
-        """Connect to the Playwright MCP server."""
         # Configure the MCP server parameters based on .mcp.json
+        # (plus --headless: nobody needs to watch the browser while Claude works).
+        # With "latest", npx asks the npm registry which version that is every
+        # time a session starts; a pinned version is run straight from npx's cache.
+        # prefer_offline/audit=false also stop npm from going online when the
+        # package is already cached (these are added to the default environment).
+        mcp_version = os.getenv("PLAYWRIGHT_MCP_VERSION", "latest")
         server_params = StdioServerParameters(
             command="npx",
-            args=["@playwright/mcp@latest", "--executable-path", "/usr/bin/chromium"],
-            env=None
+            args=[
+                f"@playwright/mcp@{mcp_version}",
+                "--executable-path", "/usr/bin/chromium",
+                "--headless"
+            ],
+            env={
+                "npm_config_prefer_offline": "true",
+                "npm_config_audit": "false"
+            }
         )
-
-        # Connect to the server
-        stdio_transport = await self.exit_stack.enter_async_context(
-            stdio_client(server_params)
+        self.pool = MCPSessionPool(
+            server_params,
+            min_sessions=min_sessions,
+            max_sessions=max_sessions
         )
 
-        self.stdio, self.write = stdio_transport
-        self.session = await self.exit_stack.enter_async_context(
-            ClientSession(self.stdio, self.write)
-        )
+        # The server's tools don't change while we're connected, so the list is
+        # fetched once and reused by every run_agent_loop() call
+        self.tool_cache_ttl_s = tool_cache_ttl_s
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_cache_ts = 0.0
+
+    async def connect(self):
+        """Connect to the Playwright MCP server (starts the session pool)."""
+        await self.pool.start()
 
-        # Initialize the session
-        await self.session.initialize()
+        # A new server may offer different tools
+        self._tools_cache = None
 
-        print("✓ Connected to Playwright MCP server")
+        if self.verbose:
+            print("✓ Connected to Playwright MCP server")
 
     async def disconnect(self):
-        """Disconnect from the MCP server."""
-        await self.exit_stack.aclose()
-        print("✓ Disconnected from Playwright MCP server")
+        """Disconnect from the MCP server (closes every pooled session)."""
+        await self.pool.stop()
+        self._tools_cache = None
+        if self.verbose:
+            print("✓ Disconnected from Playwright MCP server")
 
-    async def get_available_tools(self) -> List[Dict[str, Any]]:
+    async def get_available_tools(self, session: Optional["ClientSession"] = None) -> List[Dict[str, Any]]:
         """
         Get the list of available tools from the MCP server.
 
+        The list is cached for tool_cache_ttl_s seconds, so repeated calls don't
+        ask the server again.
+
+        Args:
+            session: MCP session to ask (borrowed from the pool if not given)
+
         Returns:
             List of tools in Anthropic tool format
         """
-        if not self.session:
+        if not self.pool.running:
             raise RuntimeError("Not connected to MCP server. Call connect() first.")
 
+        # Reuse the cached list if it is still fresh
+        if (self._tools_cache is not None
+                and time.monotonic() - self._tools_cache_ts < self.tool_cache_ttl_s):
+            return self._tools_cache
+
         # List tools from the MCP server
-        response = await self.session.list_tools()
+        if session is None:
+            async with self.pool.session() as session:
+                response = await session.list_tools()
+        else:
+            response = await session.list_tools()
 
         # Convert MCP tools to Anthropic tool format
         anthropic_tools = []
@@ -91,28 +327,183 @@ class PlaywrightMCPClient:
             }
             anthropic_tools.append(anthropic_tool)
 
-        print(f"✓ Retrieved {len(anthropic_tools)} tools from MCP server")
+        if self.verbose:
+            print(f"✓ Retrieved {len(anthropic_tools)} tools from MCP server")
+
+        self._tools_cache = anthropic_tools
+        self._tools_cache_ts = time.monotonic()
         return anthropic_tools
 
-    async def call_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
+    async def call_tool(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+        session: Optional["ClientSession"] = None,
+        cache: Optional[ToolResultCache] = None
+    ) -> Any:
         """
         Call a tool on the MCP server.
 
         Args:
             tool_name: Name of the tool to call
             tool_input: Input parameters for the tool
+            session: MCP session to use (borrowed from the pool if not given).
+                     Pass the same session for related calls - each session
+                     has its own browser.
+            cache: Optional cache of read-only results for this session
 
         Returns:
             Tool execution result
         """
-        if not self.session:
+        if not self.pool.running:
             raise RuntimeError("Not connected to MCP server. Call connect() first.")
 
+        # Return a saved result for cacheable tools; tools that aren't read-only
+        # may change the page, so the saved results are thrown away
+        readonly = tool_name in READONLY_TOOLS
+        cacheable = tool_name in CACHEABLE_TOOLS
+        if cache is not None:
+            if cacheable:
+                key = ToolResultCache.key(tool_name, tool_input)
+                cached = cache.get(key)
+                if isinstance(cached, asyncio.Task):
+                    # A speculative call for exactly this - use it (if it worked).
+                    # shield() keeps our own cancellation from cancelling the
+                    # speculative task, so if it ends up cancelled, it was
+                    # cancelled by cache.clear() (another tool changed the page)
+                    # and we make a normal call instead.
+                    try:
+                        result = await asyncio.shield(cached)
+                        if self.verbose:
+                            print(f"  ✓ Using speculative result for {tool_name}")
+                        cache.put(key, result)
+                        return result
+                    except asyncio.CancelledError:
+                        if not cached.cancelled() or asyncio.current_task().cancelling():
+                            raise
+                    except Exception:
+                        pass
+                elif cached is not None:
+                    if self.verbose:
+                        print(f"  ✓ Reusing cached result for {tool_name}")
+                    return cached
+            elif not readonly:
+                cache.clear()
+
         # Call the tool via MCP
-        result = await self.session.call_tool(tool_name, arguments=tool_input)
+        if session is None:
+            async with self.pool.session() as borrowed:
+                result = await borrowed.call_tool(tool_name, arguments=tool_input)
+        else:
+            result = await session.call_tool(tool_name, arguments=tool_input)
+
+        if cache is not None:
+            if cacheable:
+                cache.put(key, result)
+            elif not readonly:
+                # Drop anything a read-only tool saved while this one was running
+                cache.clear()
+
+                # Start the tool Claude will most likely ask for next. This only
+                # makes sense on the caller's own session (a borrowed one is
+                # given back before Claude's next request).
+                next_tool = SPECULATION_MAP.get(tool_name)
+                if next_tool and session is not None:
+                    self._speculate(next_tool, session, cache)
 
         return result
 
+    def _speculate(self, tool_name: str, session: "ClientSession", cache: ToolResultCache):
+        """
+        Start a read-only tool call in the background and put it in the cache.
+
+        If Claude then asks for it, call_tool() waits for this task instead of
+        starting a new call. If Claude does something else first, clearing the
+        cache cancels it.
+
+        Args:
+            tool_name: The read-only tool to run (with no arguments)
+            session: The session the agent loop is using
+            cache: The agent loop's result cache
+        """
+        task = asyncio.create_task(session.call_tool(tool_name, arguments={}))
+
+        # Mark any error as seen, so an unused failed speculation isn't reported
+        # as "Task exception was never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        cache.put(ToolResultCache.key(tool_name, {}), task)
+
+    async def _execute_tool(
+        self,
+        block: Any,
+        session: "ClientSession",
+        semaphore: asyncio.Semaphore,
+        cache: ToolResultCache,
+        after: List[asyncio.Task]
+    ) -> Dict[str, Any]:
+        """
+        Run one tool_use block from Claude via MCP and build its tool_result.
+
+        Errors are reported back to Claude in the tool_result instead of being
+        raised, so one failing tool doesn't stop the others.
+
+        Args:
+            block: A tool_use content block from Claude's response
+            session: The MCP session this agent loop is using
+            semaphore: Limits how many tools run at the same time
+            cache: Read-only tool results saved during this agent loop
+            after: Earlier tool calls that must finish before this one starts
+
+        Returns:
+            A tool_result content block for the next message to Claude
+        """
+        try:
+            # All tools share one browser, so wait for the calls this one
+            # depends on (they report their own errors, so only waiting matters)
+            if after:
+                await asyncio.wait(after)
+
+            async with semaphore:
+                result = await self.call_tool(block.name, block.input, session, cache)
+
+            # MCP returns a list of content items
+            # Convert to string for Anthropic
+            if hasattr(result, 'content'):
+                result_str = _concat_texts(result.content)
+            else:
+                result_str = str(result)
+
+            # Very large results (like a full page snapshot) are cut short: they
+            # would be re-sent to Claude with every later message. The middle is
+            # dropped, because the end of a snapshot is the page footer (where
+            # links like the social media ones usually are).
+            if len(result_str) > self.max_tool_result_chars:
+                head = self.max_tool_result_chars // 2
+                tail = self.max_tool_result_chars - head
+                extra = len(result_str) - self.max_tool_result_chars
+                result_str = (result_str[:head]
+                              + f"\n[...truncated {extra} chars...]\n"
+                              + result_str[-tail:])
+
+            if self.verbose:
+                print(f"  ✓ Tool {block.name} executed successfully")
+
+            return {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": result_str
+            }
+        except Exception as e:
+            if self.verbose:
+                print(f"  ✗ Tool {block.name} failed: {e}")
+            return {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": f"Error: {str(e)}",
+                "is_error": True
+            }
+
     async def run_agent_loop(
         self,
         user_message: str,
@@ -125,6 +516,7 @@ class PlaywrightMCPClient:
         This implements the tool calling loop:
         1. Send message to Claude with available tools
         2. If Claude wants to use a tool, execute it via MCP
+           (tools start while Claude's response is still streaming in)
         3. Send tool results back to Claude
         4. Repeat until Claude provides a final answer
 
@@ -138,117 +530,220 @@ class PlaywrightMCPClient:
             If final_answer_tool is provided: the structured data from that tool
             Otherwise: Claude's final text response
         """
+        # Borrow one MCP session (one browser) for the whole conversation, so
+        # every tool call Claude makes sees the page the previous one left behind
+        async with self.pool.session() as session:
+            return await self._agent_loop(session, user_message, max_iterations, final_answer_tool)
+
+    async def run_many(
+        self,
+        prompts: List[str],
+        concurrency: int = 4,
+        max_iterations: int = 10,
+        final_answer_tool: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Run several independent agent loops at the same time.
+
+        Each prompt gets its own run_agent_loop() (and so its own pooled MCP
+        session and browser). While one loop waits for Claude, the others can
+        run their tools, so N prompts take far less than N times as long.
+
+        Args:
+            prompts: The user requests, one agent loop each
+            concurrency: How many loops run at the same time (never more than
+                         the pool's max_sessions, since each loop holds a session)
+            max_iterations: Passed to each run_agent_loop()
+            final_answer_tool: Passed to each run_agent_loop()
+
+        Returns:
+            One result per prompt, in the same order. A loop that raised an
+            error gets the exception object instead of a result.
+        """
+        # Loops beyond max_sessions would wait for a free session, and give up
+        # after the pool's borrow timeout (shorter than a typical agent loop),
+        # so they wait here instead, where there is no timeout
+        semaphore = asyncio.Semaphore(min(concurrency, self.pool.max_sessions))
+
+        async def run_one(prompt: str) -> Any:
+            async with semaphore:
+                return await self.run_agent_loop(prompt, max_iterations, final_answer_tool)
+
+        return await asyncio.gather(
+            *[run_one(prompt) for prompt in prompts],
+            return_exceptions=True
+        )
+
+    async def _agent_loop(
+        self,
+        session: "ClientSession",
+        user_message: str,
+        max_iterations: int,
+        final_answer_tool: Optional[Dict[str, Any]]
+    ) -> Any:
+        """The body of run_agent_loop(), using an already borrowed session."""
         # Get available tools from MCP
-        tools = await self.get_available_tools()
+        # (copied, because the list is cached and must not include final_answer_tool)
+        tools = list(await self.get_available_tools(session))
 
         # Add the final answer tool if provided (for structured outputs)
         if final_answer_tool:
             tools.append(final_answer_tool)
 
-        # Initialize conversation messages
-        messages = [{"role": "user", "content": user_message}]
+        # Prompt caching: the tools and the first message are sent again with
+        # every iteration. Marking where they end with cache_control lets the API
+        # reuse its work on them instead of processing them from scratch each time.
+        # (The last tool is copied so the cached tool list isn't modified.)
+        if tools:
+            tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
 
-        print(f"\n{'='*70}")
-        print("Starting agentic loop with Claude + Playwright MCP")
-        print(f"{'='*70}\n")
-
-        iteration = 0
-        while iteration < max_iterations:
-            iteration += 1
-            print(f"--- Iteration {iteration} ---")
-
-            # Call Claude with tools
-            response = self.anthropic.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=4000,
-                tools=tools,
-                messages=messages
-            )
-
-            print(f"Stop reason: {response.stop_reason}")
-
-            # Check if Claude wants to use tools
-            if response.stop_reason == "tool_use":
-                # Add Claude's response to messages
-                messages.append({
-                    "role": "assistant",
-                    "content": response.content
-                })
-
-                # Process each tool use
-                tool_results = []
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_name = block.name
-                        tool_input = block.input
-                        tool_use_id = block.id
-
-                        print(f"  → Claude wants to use tool: {tool_name}")
-                        print(f"    Input: {json.dumps(tool_input, indent=2)[:200]}...")
-
-                        # Check if this is the final answer tool
-                        if final_answer_tool and tool_name == final_answer_tool["name"]:
-                            print(f"  ✓ Claude provided structured final answer")
-                            return tool_input
-
-                        # Execute the tool via MCP
-                        try:
-                            result = await self.call_tool(tool_name, tool_input)
-
-                            # MCP returns a list of content items
-                            # Convert to string for Anthropic
-                            if hasattr(result, 'content'):
-                                result_content = []
-                                for item in result.content:
-                                    if hasattr(item, 'text'):
-                                        result_content.append(item.text)
-                                result_str = "\n".join(result_content)
+        # Initialize conversation messages
+        messages = [{
+            "role": "user",
+            "content": [{
+                "type": "text",
+                "text": user_message,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        }]
+
+        # Limits how many read-only tool calls run at once over this session's connection
+        tool_semaphore = asyncio.Semaphore(self.max_parallel_tools)
+
+        # Results of read-only tools (like snapshots) in this session's browser
+        tool_cache = ToolResultCache(self.tool_result_cache_size)
+
+        if self.verbose:
+            print(f"\n{'='*70}")
+            print("Starting agentic loop with Claude + Playwright MCP")
+            print(f"{'='*70}\n")
+
+        # Name of the structured-output tool (None if there isn't one), looked up once
+        final_answer_name = final_answer_tool["name"] if final_answer_tool else None
+
+        try:
+            iteration = 0
+            while iteration < max_iterations:
+                iteration += 1
+                if self.verbose:
+                    print(f"--- Iteration {iteration} ---")
+
+                # Call Claude with tools, streaming the response.
+                # Each tool call starts running as soon as Claude has finished writing
+                # it, while Claude may still be writing the next one.
+                tool_tasks = []
+
+                # Tools that only read the page run at the same time, but a
+                # tool that changes the page must not overlap with anything
+                # requested before or after it: a snapshot asked for after a
+                # click has to see the page after the click.
+                last_write: Optional[asyncio.Task] = None
+                reads_since_write: List[asyncio.Task] = []
+
+                # If the request fails part-way (API or network error), stop the
+                # tools it already started - otherwise they would keep using the
+                # browser after the session has gone back to the pool
+                try:
+                    async with self.anthropic.messages.stream(
+                        model="claude-sonnet-4-5-20250929",
+                        max_tokens=4000,
+                        tools=tools,
+                        messages=messages
+                    ) as stream:
+                        async for event in stream:
+                            if event.type != "content_block_stop" or event.content_block.type != "tool_use":
+                                continue
+
+                            block = event.content_block
+                            if self.verbose:
+                                print(f"  → Claude wants to use tool: {block.name}")
+                                preview = orjson.dumps(block.input, option=orjson.OPT_INDENT_2)[:200]
+                                print(f"    Input: {preview.decode(errors='ignore')}...")
+
+                            # Check if this is the final answer tool
+                            if block.name == final_answer_name:
+                                if self.verbose:
+                                    print(f"  ✓ Claude provided structured final answer")
+                                # Any tools still running are no longer needed
+                                await _cancel_and_wait(tool_tasks)
+                                return block.input
+
+                            previous_write = [last_write] if last_write else []
+                            if block.name in READONLY_TOOLS:
+                                after = previous_write
                             else:
-                                result_str = str(result)
-
-                            print(f"  ✓ Tool executed successfully")
-
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_use_id,
-                                "content": result_str
-                            })
-                        except Exception as e:
-                            print(f"  ✗ Tool execution failed: {e}")
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_use_id,
-                                "content": f"Error: {str(e)}",
-                                "is_error": True
-                            })
-
-                # Add tool results to messages
-                messages.append({
-                    "role": "user",
-                    "content": tool_results
-                })
-
-            elif response.stop_reason == "end_turn":
-                # Claude has finished - extract the final text response
-                final_response = ""
-                for block in response.content:
-                    if hasattr(block, 'text'):
-                        final_response += block.text
-
-                print(f"\n✓ Claude finished after {iteration} iterations")
-                return final_response
-            else:
-                # Unexpected stop reason
-                print(f"Unexpected stop reason: {response.stop_reason}")
-                break
+                                after = reads_since_write + previous_write
+
+                            task = asyncio.create_task(
+                                self._execute_tool(block, session, tool_semaphore, tool_cache, after)
+                            )
+                            tool_tasks.append(task)
 
-        print(f"\n✗ Reached max iterations ({max_iterations})")
-        return "Error: Maximum iterations reached without completion"
+                            if block.name in READONLY_TOOLS:
+                                reads_since_write.append(task)
+                            else:
+                                last_write = task
+                                reads_since_write = []
+
+                        response = await stream.get_final_message()
+                except BaseException:
+                    await _cancel_and_wait(tool_tasks)
+                    raise
+
+                if self.verbose:
+                    print(f"Stop reason: {response.stop_reason}")
+
+                # Check if Claude wants to use tools
+                if response.stop_reason == "tool_use":
+                    # Add Claude's response to messages. Only the text and the tool
+                    # calls are needed to continue; any other block would just be
+                    # sent again (and paid for) on every following iteration.
+                    messages.append({
+                        "role": "assistant",
+                        "content": [
+                            block for block in response.content
+                            if block.type in ("text", "tool_use")
+                        ]
+                    })
+
+                    # Wait for the tool calls that were started while streaming.
+                    # gather() returns the results in the order the tools were requested.
+                    tool_results = await asyncio.gather(*tool_tasks)
+
+                    # Add tool results to messages
+                    messages.append({
+                        "role": "user",
+                        "content": tool_results
+                    })
+
+                elif response.stop_reason == "end_turn":
+                    # Claude has finished - extract the final text response
+                    final_response = "".join(
+                        block.text for block in response.content if block.type == "text"
+                    )
+
+                    if self.verbose:
+                        print(f"\n✓ Claude finished after {iteration} iterations")
+                    return final_response
+                else:
+                    # Unexpected stop reason
+                    if self.verbose:
+                        print(f"Unexpected stop reason: {response.stop_reason}")
+                    await _cancel_and_wait(tool_tasks)
+                    break
+
+            if self.verbose:
+                print(f"\n✗ Reached max iterations ({max_iterations})")
+            return "Error: Maximum iterations reached without completion"
+        finally:
+            # Stop any speculative call that is still running, and wait until
+            # it has, before the session goes back to the pool and another
+            # loop borrows it
+            await _cancel_and_wait(tool_cache.clear())
 
 
 async def main():
     """Example usage of the PlaywrightMCPClient."""
-    import os
     from dotenv import load_dotenv
 
     load_dotenv()
@@ -283,7 +778,15 @@ async def main():
 
     finally:
         await client.disconnect()
+        await close_http_client()
 
 
 if __name__ == "__main__":
+    # Use uvloop (a faster drop-in event loop) if it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Pool of warm MCP sessions
+
+Connecting to the Playwright MCP server means starting a Node.js process
+(npx @playwright/mcp) and doing the MCP "initialize" handshake, which takes
+seconds. This module keeps a few connected sessions around and lends them out,
+so only the first request pays that cost.
+
+Each session has its own MCP server and therefore its own browser, so work
+done through one session (navigating, clicking) doesn't affect the others.
+
+Usage:
+    pool = MCPSessionPool(server_params, min_sessions=1, max_sessions=4)
+    await pool.start()
+    async with pool.session() as session:
+        result = await session.call_tool("browser_navigate", {"url": "..."})
+    await pool.stop()
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Set
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+
+class _PooledSession:
+    """
+    One MCP server process and the ClientSession connected to it.
+
+    The stdio connection has to be opened and closed by the same asyncio task,
+    so a background task owns it for the session's whole life: it connects,
+    signals that the session is ready, then waits until close() is called.
+    """
+
+    def __init__(self, server_params: StdioServerParameters):
+        self.server_params = server_params
+        self.session: Optional[ClientSession] = None
+        self.created_at = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def open(self):
+        """Start the server and wait until the session is initialized."""
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+
+        if self._error:
+            raise self._error
+
+    async def close(self):
+        """Disconnect and stop the server (also if it is still starting up)."""
+        self._closing.set()
+        if self._task:
+            # Still connecting: stop the handshake instead of waiting for it
+            if not self._ready.is_set():
+                self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self):
+        """Background task that owns the connection."""
+        try:
+            async with stdio_client(self.server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            # If the server dies, session becomes None and the pool drops it
+            self.session = None
+            self._ready.set()
+
+
+class MCPSessionPool:
+    """
+    Keeps MCP sessions connected and lends them out one caller at a time.
+
+    - start() connects min_sessions sessions up front
+    - session() lends an idle session, connecting a new one if none is idle
+      and fewer than max_sessions exist, otherwise waiting up to
+      borrow_timeout_s for one to be returned
+    - sessions older than max_session_lifetime_s are replaced, so a browser
+      that has been running for a long time doesn't keep growing
+    """
+
+    def __init__(
+        self,
+        server_params: StdioServerParameters,
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        borrow_timeout_s: float = 120.0,
+        max_session_lifetime_s: float = 600.0
+    ):
+        """
+        Initialize the pool (nothing is started until start() is called).
+
+        Args:
+            server_params: How to start the MCP server
+            min_sessions: Sessions connected by start()
+            max_sessions: Maximum number of sessions open at the same time
+            borrow_timeout_s: How long session() waits for a free session
+            max_session_lifetime_s: Age after which a session is replaced
+        """
+        self.server_params = server_params
+        self.min_sessions = min_sessions
+        self.max_sessions = max_sessions
+        self.borrow_timeout_s = borrow_timeout_s
+        self.max_session_lifetime_s = max_session_lifetime_s
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._sessions: Set[_PooledSession] = set()
+
+        # Sessions that exist or are being opened (counted before the slow
+        # open finishes, so concurrent callers can't go over max_sessions)
+        self._size = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether start() has been called (and stop() hasn't)."""
+        return self._idle is not None
+
+    async def start(self):
+        """Connect min_sessions sessions so the first callers don't wait."""
+        if self.running:
+            return
+
+        self._idle = asyncio.Queue()
+        opened = await asyncio.gather(*[self._open() for _ in range(self.min_sessions)])
+        for pooled in opened:
+            self._idle.put_nowait(pooled)
+
+    async def stop(self):
+        """Disconnect every session, including ones that are still lent out."""
+        if not self.running:
+            return
+
+        await asyncio.gather(*[pooled.close() for pooled in self._sessions])
+        self._sessions.clear()
+        self._size = 0
+        self._idle = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """
+        Borrow a connected session for the duration of an `async with` block.
+
+        Yields:
+            A ClientSession that no one else uses until the block ends
+        """
+        if not self.running:
+            raise RuntimeError("MCP session pool is not running. Call start() first.")
+
+        pooled = await self._borrow()
+        try:
+            yield pooled.session
+        finally:
+            await self._return(pooled)
+
+    async def _borrow(self) -> _PooledSession:
+        """Take an idle, healthy session, opening a new one if allowed."""
+        while True:
+            if self._idle.empty() and self._size < self.max_sessions:
+                return await self._open()
+
+            pooled = await asyncio.wait_for(self._idle.get(), self.borrow_timeout_s)
+
+            # None means a session was dropped and there is room to open a new one
+            if pooled is None:
+                continue
+
+            # Skip sessions whose server died or that are too old
+            if pooled.session is None or self._expired(pooled):
+                await self._discard(pooled)
+                continue
+
+            return pooled
+
+    async def _return(self, pooled: _PooledSession):
+        """Put a session back, replacing it later if it is too old."""
+        if not self.running:
+            return
+
+        if pooled.session is None or self._expired(pooled):
+            await self._discard(pooled)
+            # Wake up anyone waiting for a session: they can open a new one now
+            if self.running:
+                self._idle.put_nowait(None)
+        else:
+            self._idle.put_nowait(pooled)
+
+    async def _open(self) -> _PooledSession:
+        """Start a new server and connect to it."""
+        self._size += 1
+        pooled = _PooledSession(self.server_params)
+        try:
+            await pooled.open()
+        except BaseException:
+            # If we were cancelled while the server was starting, its process
+            # is still running: stop it (shielded, so the cancellation can't
+            # interrupt the clean-up) so it isn't left behind
+            self._size -= 1
+            await asyncio.shield(pooled.close())
+            raise
+
+        self._sessions.add(pooled)
+        return pooled
+
+    async def _discard(self, pooled: _PooledSession):
+        """Close a session and forget about it."""
+        self._sessions.discard(pooled)
+        self._size -= 1
+        await pooled.close()
+
+    def _expired(self, pooled: _PooledSession) -> bool:
+        """Check whether a session has lived longer than max_session_lifetime_s."""
+        return time.monotonic() - pooled.created_at > self.max_session_lifetime_s